@@ -0,0 +1,112 @@
+"""
+Decode preset benchmark for the Hotkey Audio Transcriber MVP
+
+Transcribes a fixture recording once per decode preset and reports the
+real-time factor (processing time / audio duration) and the share of
+decoding windows that needed a temperature fallback retry.
+
+Usage:
+    python benchmarks/decode_presets.py path/to/fixture.wav [--presets fastest accurate]
+"""
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Source modules use flat imports (e.g. `from config import ...`)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import whisper  # noqa: E402
+
+from config import DECODE_PRESETS, WHISPER_MODEL  # noqa: E402
+from transcriber import Transcriber  # noqa: E402
+
+
+@contextmanager
+def record_decodes(model):
+    """Record the temperature of every model.decode() call made inside the block
+
+    Segments only cover windows Whisper kept, so windows it decoded and then
+    skipped as silence would be missing; counting decode calls sees them all.
+    """
+    temperatures = []
+    original = model.decode
+
+    def decode(mel, *args, **kwargs):
+        options = args[0] if args else kwargs.get("options")
+        temperatures.append(getattr(options, "temperature", 0.0))
+        return original(mel, *args, **kwargs)
+
+    # An instance attribute shadows Whisper.decode until it is deleted again
+    model.decode = decode
+    try:
+        yield temperatures
+    finally:
+        del model.decode
+
+
+def retry_stats(temperatures, first_temperature):
+    """Count decoded windows and how many of them fell back to a higher temperature
+
+    Whisper decodes each window at the first temperature of the ladder and
+    then once per fallback, so every call at `first_temperature` starts a
+    new window and any other call is a retry of the current one.
+    """
+    windows = retried = 0
+    retrying = False
+    for temperature in temperatures:
+        if temperature == first_temperature:
+            windows += 1
+            retrying = False
+        elif not retrying:
+            retried += 1
+            retrying = True
+    return windows, retried
+
+
+def run_benchmark(audio_path, presets):
+    transcriber = Transcriber()
+    if not transcriber.load_model():
+        sys.exit(1)
+
+    # Decode once up front so ffmpeg time is not charged to any preset
+    audio = whisper.load_audio(str(audio_path))
+    duration = len(audio) / whisper.audio.SAMPLE_RATE
+
+    print(f"Model: {WHISPER_MODEL}  Fixture: {audio_path} ({duration:.1f}s)")
+    print(f"{'preset':<10} {'seconds':>9} {'RTF':>7} {'windows':>8} {'retried':>8} {'retry %':>8}")
+
+    for name in presets:
+        options = transcriber.get_decode_options(name)
+        with record_decodes(transcriber.model) as temperatures:
+            start = time.perf_counter()
+            transcriber.run_whisper(audio, preset=name)
+            elapsed = time.perf_counter() - start
+
+        windows, retried = retry_stats(temperatures, options["temperature"][0])
+        retry_pct = 100.0 * retried / windows if windows else 0.0
+        print(
+            f"{name:<10} {elapsed:>9.2f} {elapsed / duration:>7.3f} "
+            f"{windows:>8d} {retried:>8d} {retry_pct:>7.1f}%"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Whisper decode presets")
+    parser.add_argument("audio", type=Path, help="Fixture audio file to transcribe")
+    parser.add_argument(
+        "--presets", nargs="+", default=list(DECODE_PRESETS),
+        choices=list(DECODE_PRESETS), help="Presets to benchmark (default: all)"
+    )
+    args = parser.parse_args()
+
+    if not args.audio.exists():
+        print(f"ERROR: Audio file not found: {args.audio}")
+        sys.exit(1)
+
+    run_benchmark(args.audio, args.presets)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""
+Load test harness for the Hotkey Audio Transcriber MVP
+
+Simulates many users hitting stop at once: synthetic sessions arrive at a
+Poisson rate, wait in a queue for one of a fixed pool of transcription
+workers, and are timed from "stop" (arrival) until their transcript has been
+written by `save_transcript`. Each worker owns its own `Transcriber`, the same
+way each running copy of the app owns one.
+
+The run is repeated for every requested arrival rate to build a capacity
+curve. A rate is sustainable when p95 latency stays inside the SLO and the
+workers keep up with arrivals: their utilization over the arrival window
+stays below 100% and completions within that window track the arrival rate.
+The capacity estimate is the highest sustainable rate.
+
+Every saved transcript is checked on disk: a session whose file is missing
+or shared with another session is reported as `lost`, left out of the
+latency and throughput figures, and disqualifies its rate.
+
+Usage:
+    # Fake model: 0.2s fixed + 0.1s per second of audio, 4 workers
+    python benchmarks/load_test.py --workers 4 --rates 1 2 4 8
+
+    # Real local Whisper model against a fixture recording
+    python benchmarks/load_test.py --model real --audio fixture.wav --workers 2 --rates 0.05 0.1 0.2
+"""
+import argparse
+import csv
+import math
+import os
+import queue
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+import wave
+from array import array
+from collections import Counter
+from pathlib import Path
+
+# Source modules use flat imports (e.g. `from config import ...`)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import file_manager  # noqa: E402
+import transcriber as transcriber_module  # noqa: E402
+from config import DECODE_PRESETS, DECODE_PRESET  # noqa: E402
+from file_manager import save_transcript  # noqa: E402
+from transcriber import Transcriber  # noqa: E402
+
+
+class FakeWhisperModel:
+    """Stand-in for a Whisper model with tunable latency
+
+    Each call costs `base_latency + rtf * audio_seconds`. In `sleep` mode the
+    worker blocks for that long without using CPU (like a GPU or an
+    out-of-process model). In `spin` mode it does that many seconds of CPU
+    work, measured on its own thread clock, so workers competing for CPU take
+    longer in wall time. The spin loop is pure Python and holds the GIL: all
+    spinning workers share one core, so this models a CPU-bound model on a
+    single core rather than torch's multi-threaded kernels.
+    """
+
+    def __init__(self, base_latency=0.2, rtf=0.1, mode='sleep'):
+        self.base_latency = base_latency
+        self.rtf = rtf
+        self.mode = mode
+
+    def transcribe(self, audio, **options):
+        with wave.open(str(audio), 'rb') as wf:
+            duration = wf.getnframes() / wf.getframerate()
+
+        cost = self.base_latency + self.rtf * duration
+        if self.mode == 'spin':
+            deadline = time.thread_time() + cost
+            while time.thread_time() < deadline:
+                pass
+        else:
+            time.sleep(cost)
+
+        text = "this is a synthetic load test transcript"
+        segments = [
+            {"seek": 0, "start": 0.0, "end": duration, "text": text, "temperature": 0.0}
+        ]
+        return {"text": text, "segments": segments}
+
+
+class ResourceSampler:
+    """Samples process CPU utilization and resident memory in the background"""
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.cpu_samples = []
+        self.rss_samples = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        cores = os.cpu_count() or 1
+        last_wall = time.perf_counter()
+        last_cpu = time.process_time()
+        while not self._stop.wait(self.interval):
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            # Percent of the whole machine, so 100% means every core is busy
+            self.cpu_samples.append(100.0 * (cpu - last_cpu) / ((wall - last_wall) * cores))
+            self.rss_samples.append(current_rss_mb())
+            last_wall, last_cpu = wall, cpu
+
+
+def current_rss_mb():
+    """Current resident set size in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and kilobytes on Linux
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def write_synthetic_wav(path, seconds, sample_rate=16000):
+    """Write a mono 16-bit WAV containing a quiet tone"""
+    samples = array('h', (
+        int(3000 * math.sin(2 * math.pi * 220 * i / sample_rate))
+        for i in range(int(seconds * sample_rate))
+    ))
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(samples.tobytes())
+
+
+def build_transcriber(args):
+    transcriber = Transcriber()
+    if args.model == 'fake':
+        transcriber.model = FakeWhisperModel(args.fake_base_latency, args.fake_rtf, args.fake_mode)
+        transcriber.model_loaded = True
+    elif not transcriber.load_model():
+        sys.exit(1)
+    return transcriber
+
+
+def run_step(rate, args, transcribers, audio_path, transcripts_dir):
+    """Drive sessions at `rate` arrivals/second for one step and summarize them"""
+    transcripts_dir.mkdir(parents=True, exist_ok=True)
+    file_manager.TRANSCRIPTS_DIR = transcripts_dir
+    pending = queue.Queue()
+    results = []
+    results_lock = threading.Lock()
+
+    def worker(transcriber):
+        while True:
+            arrival = pending.get()
+            if arrival is None:
+                return
+            started = time.perf_counter()
+            text = transcriber.transcribe_audio(str(audio_path), preset=args.preset)
+            saved = save_transcript(text) if text else None
+            finished = time.perf_counter()
+            with results_lock:
+                results.append((arrival, started, finished, saved))
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in transcribers]
+    for thread in threads:
+        thread.start()
+
+    sampler = ResourceSampler()
+    sampler.start()
+
+    # Long enough for an overloaded rate to build up a visible backlog
+    sessions = args.sessions or max(1, math.ceil(rate * args.duration))
+    rng = random.Random(args.seed)
+    begin = time.perf_counter()
+    next_arrival = begin
+    last_arrival = begin
+    for _ in range(sessions):
+        next_arrival += rng.expovariate(rate)
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        last_arrival = time.perf_counter()
+        pending.put(last_arrival)
+
+    for _ in threads:
+        pending.put(None)
+    for thread in threads:
+        thread.join()
+    sampler.stop()
+
+    saved = [r for r in results if r[3]]
+    # Only count sessions whose transcript really is on disk and is their own
+    writers = Counter(r[3] for r in saved)
+    ok = [r for r in saved if writers[r[3]] == 1 and Path(r[3]).exists()]
+    lost = len(saved) - len(ok)
+    latencies = [finished - arrival for arrival, _, finished, _ in ok]
+    waits = [started - arrival for arrival, started, _, _ in ok]
+    last_finish = max((r[2] for r in results), default=begin)
+    arrival_span = last_arrival - begin
+    # Share of the workers' capacity used while sessions were arriving; 100%
+    # or more means work arrived faster than the pool could process it
+    busy = sum(finished - started for _, started, finished, _ in results)
+    utilization = busy / (len(transcribers) * arrival_span) if arrival_span > 0 else 0.0
+    in_window = sum(1 for r in ok if r[2] <= last_arrival)
+
+    return {
+        'rate': rate,
+        'sessions': sessions,
+        # Realized rate: a finite Poisson sample rarely lands exactly on `rate`
+        'arrival_rate': sessions / arrival_span if arrival_span > 0 else 0.0,
+        'completed': len(ok),
+        'lost': lost,
+        'failed': len(results) - len(saved),
+        # Completions per second while sessions were still arriving
+        'throughput': in_window / arrival_span if arrival_span > 0 else 0.0,
+        'utilization': 100.0 * utilization,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'wait_p50': percentile(waits, 50),
+        'wait_p95': percentile(waits, 95),
+        # Time the queue took to drain after the last session arrived
+        'drain': last_finish - last_arrival,
+        'cpu_mean': sum(sampler.cpu_samples) / len(sampler.cpu_samples) if sampler.cpu_samples else 0.0,
+        'cpu_max': max(sampler.cpu_samples, default=0.0),
+        'rss_peak_mb': max(sampler.rss_samples, default=current_rss_mb()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the transcription path")
+    parser.add_argument("--model", choices=['fake', 'real'], default='fake',
+                        help="Fake model with tunable latency, or the configured Whisper model")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="Concurrent transcription workers (each loads its own model)")
+    parser.add_argument("--duration", type=float, default=60.0,
+                        help="Seconds of arrivals per rate step")
+    parser.add_argument("--sessions", type=int,
+                        help="Fixed number of sessions per rate step (overrides --duration)")
+    parser.add_argument("--rates", type=float, nargs='+', default=[0.5, 1, 2, 4, 8],
+                        help="Arrival rates to sweep, in sessions per second")
+    parser.add_argument("--audio", type=Path, help="Fixture recording (default: synthetic tone)")
+    parser.add_argument("--audio-seconds", type=float, default=30.0,
+                        help="Length of the synthetic recording")
+    parser.add_argument("--preset", choices=list(DECODE_PRESETS), default=DECODE_PRESET)
+    parser.add_argument("--fake-base-latency", type=float, default=0.2,
+                        help="Fake model: fixed seconds per transcription")
+    parser.add_argument("--fake-rtf", type=float, default=0.1,
+                        help="Fake model: extra seconds per second of audio")
+    parser.add_argument("--fake-mode", choices=['sleep', 'spin'], default='sleep',
+                        help="Fake model: block idle, or burn the same amount of CPU time "
+                             "(GIL-bound, so at most one core)")
+    parser.add_argument("--slo", type=float, default=10.0,
+                        help="p95 stop-to-transcript target in seconds for the capacity estimate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", type=Path, help="Also write the capacity curve to this CSV file")
+    parser.add_argument("--verbose", action='store_true', help="Keep per-session console feedback")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        transcriber_module.ENABLE_CONSOLE_FEEDBACK = False
+        file_manager.ENABLE_CONSOLE_FEEDBACK = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_path = args.audio
+        if audio_path is None:
+            audio_path = Path(tmp) / 'load_test.wav'
+            write_synthetic_wav(audio_path, args.audio_seconds)
+        elif not audio_path.exists():
+            print(f"ERROR: Audio file not found: {audio_path}")
+            sys.exit(1)
+
+        transcribers = [build_transcriber(args) for _ in range(args.workers)]
+
+        step_size = f"{args.sessions} sessions" if args.sessions else f"{args.duration:.0f}s"
+        print(f"Model: {args.model}  Workers: {args.workers}  Step: {step_size}  "
+              f"Preset: {args.preset}  Audio: {audio_path.name}")
+        print(f"{'rate/s':>7} {'arr/s':>7} {'done/s':>7} {'p50':>7} {'p95':>7} {'p99':>7} "
+              f"{'wait50':>7} {'wait95':>7} {'drain':>7} {'util%':>6} {'cpu%':>6} {'cpu%max':>7} {'rss MB':>7} {'lost':>5} {'fail':>5}")
+
+        rows = []
+        for step, rate in enumerate(args.rates):
+            # Keep load test output out of the real transcripts folder
+            transcripts_dir = Path(tmp) / f'transcripts_{step}'
+            row = run_step(rate, args, transcribers, audio_path, transcripts_dir)
+            rows.append(row)
+            print(f"{row['rate']:>7.2f} {row['arrival_rate']:>7.2f} {row['throughput']:>7.2f} "
+                  f"{row['p50']:>7.2f} {row['p95']:>7.2f} {row['p99']:>7.2f} {row['wait_p50']:>7.2f} "
+                  f"{row['wait_p95']:>7.2f} {row['drain']:>7.2f} {row['utilization']:>6.0f} {row['cpu_mean']:>6.1f} {row['cpu_max']:>7.1f} "
+                  f"{row['rss_peak_mb']:>7.0f} {row['lost']:>5d} {row['failed']:>5d}")
+
+    # Sustainable = inside the SLO and keeping up: the pool was not saturated
+    # and sessions completed about as fast as they arrived
+    sustainable = [
+        row for row in rows
+        if row['p95'] <= args.slo and row['failed'] == 0 and row['lost'] == 0
+        and row['utilization'] < 100.0
+        and row['throughput'] >= 0.9 * row['arrival_rate']
+    ]
+    if sustainable:
+        best = max(sustainable, key=lambda row: row['arrival_rate'])
+        print(f"Estimated capacity: {best['arrival_rate']:.2f} sessions/s realized "
+              f"({best['rate']:.2f}/s nominal) with p95 <= {args.slo:.1f}s on {args.workers} workers")
+    else:
+        print(f"No tested rate kept up with arrivals at p95 <= {args.slo:.1f}s; "
+              "try lower --rates or more --workers")
+
+    if any(row['lost'] for row in rows):
+        print("WARNING: Some saved transcripts were missing or shared a file with another session")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Capacity curve saved: {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Incremental log-mel benchmark for the Hotkey Audio Transcriber MVP
+
+Compares the work left to do at stop when Whisper computes the log-mel
+spectrogram of the whole recording, against finishing the features that
+IncrementalLogMel built while the audio was "captured" chunk by chunk.
+Also checks the features numerically against whisper.log_mel_spectrogram.
+
+Usage:
+    python benchmarks/mel_features.py                      # 30-minute synthetic fixture
+    python benchmarks/mel_features.py --audio fixture.wav  # real recording (needs ffmpeg)
+    python benchmarks/mel_features.py --model              # also time full stop-to-text
+"""
+import argparse
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+# Source modules use flat imports (e.g. `from config import ...`)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import numpy as np  # noqa: E402
+import torch  # noqa: E402
+import whisper  # noqa: E402
+from whisper.audio import N_SAMPLES, SAMPLE_RATE  # noqa: E402
+
+from config import AUDIO_CHUNK_SIZE, MEL_N_MELS  # noqa: E402
+from mel_features import IncrementalLogMel  # noqa: E402
+from transcriber import Transcriber  # noqa: E402
+
+# Max absolute difference allowed against Whisper's own features
+TOLERANCE = {'float32': 1e-3, 'float16': 5e-3}
+
+
+def synthetic_pcm(minutes, seed=0):
+    """Noise plus amplitude-modulated tones, as 16 kHz int16 samples"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(minutes * 60 * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 0.3 * t)
+    signal = envelope * (0.2 * np.sin(2 * np.pi * 220 * t) + 0.1 * np.sin(2 * np.pi * 1800 * t))
+    signal += 0.02 * rng.standard_normal(len(t))
+    return (np.clip(signal, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def write_wav(path, pcm):
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(pcm.tobytes())
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental log-mel features")
+    parser.add_argument("--audio", type=Path, help="Fixture recording (default: synthetic)")
+    parser.add_argument("--minutes", type=float, default=30.0, help="Length of the synthetic fixture")
+    parser.add_argument("--dtype", choices=list(TOLERANCE), default='float32')
+    parser.add_argument("--model", action='store_true',
+                        help="Also time full transcription from the WAV file vs precomputed features")
+    args = parser.parse_args()
+
+    if args.audio:
+        if not args.audio.exists():
+            print(f"ERROR: Audio file not found: {args.audio}")
+            sys.exit(1)
+        pcm = (np.clip(whisper.load_audio(str(args.audio)), -1.0, 1.0) * 32767).astype(np.int16)
+    else:
+        pcm = synthetic_pcm(args.minutes)
+    duration = len(pcm) / SAMPLE_RATE
+    audio = pcm.astype(np.float32) / 32768.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        wav_path = Path(tmp) / 'fixture.wav'
+        write_wav(wav_path, pcm)
+        print(f"Fixture: {duration / 60:.1f} min  Chunk: {AUDIO_CHUNK_SIZE} samples  Dtype: {args.dtype}")
+
+        # Whisper at stop: decode the WAV, then features for the whole recording
+        try:
+            _, file_time = timed(lambda: whisper.log_mel_spectrogram(str(wav_path), MEL_N_MELS, N_SAMPLES))
+            print(f"Whisper at stop, from WAV (ffmpeg + mel): {file_time * 1000:9.1f} ms")
+        except Exception as e:
+            print(f"Whisper at stop, from WAV: skipped ({e})")
+        reference, mel_time = timed(
+            lambda: whisper.log_mel_spectrogram(torch.from_numpy(audio), MEL_N_MELS, N_SAMPLES)
+        )
+        print(f"Whisper at stop, in-memory mel only:      {mel_time * 1000:9.1f} ms")
+
+        # Incremental: the per-chunk work happens during capture, only finalize() at stop
+        extractor = IncrementalLogMel(MEL_N_MELS, args.dtype)
+        chunk_bytes = [pcm[i:i + AUDIO_CHUNK_SIZE].tobytes() for i in range(0, len(pcm), AUDIO_CHUNK_SIZE)]
+        _, capture_time = timed(lambda: [extractor.accept(chunk) for chunk in chunk_bytes])
+        features, finalize_time = timed(extractor.finalize)
+        print(f"Incremental at stop (finalize):           {finalize_time * 1000:9.1f} ms")
+        print(f"Incremental during capture: {capture_time / len(chunk_bytes) * 1e6:.0f} us/chunk "
+              f"({100 * capture_time / duration:.2f}% of real time)")
+        print(f"Feature memory: {features.frames.nbytes / (1024 * 1024):.1f} MB")
+
+        # Numerical check against Whisper's own features
+        diff = np.abs(features.to_numpy(N_SAMPLES) - reference.numpy())
+        ok = diff.max() <= TOLERANCE[args.dtype]
+        print(f"Max abs diff vs log_mel_spectrogram: {diff.max():.2e} (mean {diff.mean():.2e}) "
+              f"-> {'OK' if ok else 'MISMATCH'}")
+
+        if args.model:
+            transcriber = Transcriber()
+            if not transcriber.load_model():
+                sys.exit(1)
+            _, from_file = timed(lambda: transcriber.run_whisper(str(wav_path)))
+            _, from_features = timed(lambda: transcriber.run_whisper(features))
+            print(f"Stop-to-text from WAV:      {from_file:8.2f} s")
+            print(f"Stop-to-text from features: {from_features + finalize_time:8.2f} s "
+                  f"(includes finalize)")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,11 @@ import time
 from pathlib import Path
 from config import (
     AUDIO_SAMPLE_RATE, AUDIO_CHANNELS, AUDIO_CHUNK_SIZE, 
-    AUDIO_FORMAT, TEMP_AUDIO_FILE, ENABLE_CONSOLE_FEEDBACK
+    AUDIO_FORMAT, TEMP_AUDIO_FILE, ENABLE_CONSOLE_FEEDBACK,
+    INCREMENTAL_MEL_FEATURES, MEL_N_MELS, MEL_FEATURE_DTYPE
 )
+from whisper.audio import SAMPLE_RATE as WHISPER_SAMPLE_RATE
+from mel_features import IncrementalLogMel
 
 
 class AudioRecorder:
@@ -19,6 +22,9 @@ class AudioRecorder:
         self.recording = False
         self.frames = []
         self.recording_thread = None
+        self.sample_rate = AUDIO_SAMPLE_RATE
+        self.mel_extractor = None
+        self.mel_features = None
         
     def list_audio_devices(self):
         """List available audio devices for debugging"""
@@ -45,15 +51,24 @@ class AudioRecorder:
             # Initialize PyAudio
             self.audio = pyaudio.PyAudio()
             
-            # Open audio stream - ensure it only captures microphone input
-            self.stream = self.audio.open(
-                format=pyaudio.paInt16,
-                channels=AUDIO_CHANNELS,
-                rate=AUDIO_SAMPLE_RATE,
-                input=True,
-                input_device_index=None,  # Use default microphone
-                frames_per_buffer=AUDIO_CHUNK_SIZE
-            )
+            # Build log-mel features as chunks arrive (needs 16 kHz mono input)
+            self.mel_features = None
+            self.mel_extractor = None
+            self.stream = None
+            if INCREMENTAL_MEL_FEATURES and AUDIO_CHANNELS == 1:
+                try:
+                    self.mel_extractor = IncrementalLogMel(MEL_N_MELS, MEL_FEATURE_DTYPE)
+                    self.stream = self._open_stream(WHISPER_SAMPLE_RATE)
+                    self.sample_rate = WHISPER_SAMPLE_RATE
+                except Exception as e:
+                    if ENABLE_CONSOLE_FEEDBACK:
+                        print(f"WARNING: Cannot record at {WHISPER_SAMPLE_RATE} Hz with incremental "
+                              f"features ({e}); recording at {AUDIO_SAMPLE_RATE} Hz instead")
+                    self.mel_extractor = None
+            
+            if self.stream is None:
+                self.stream = self._open_stream(AUDIO_SAMPLE_RATE)
+                self.sample_rate = AUDIO_SAMPLE_RATE
             
             # Start recording
             self.recording = True
@@ -87,6 +102,15 @@ class AudioRecorder:
             if self.recording_thread:
                 self.recording_thread.join()
             
+            # Only the global normalization is left to do for the features
+            if self.mel_extractor:
+                try:
+                    self.mel_features = self.mel_extractor.finalize() if self.frames else None
+                except Exception as e:
+                    print(f"ERROR: Feature extraction failed, will transcribe from file: {e}")
+                    self.mel_features = None
+                self.mel_extractor = None
+            
             # Save audio to file
             if self.frames:
                 self._save_audio()
@@ -106,15 +130,40 @@ class AudioRecorder:
         """Check if currently recording"""
         return self.recording
     
+    def get_mel_features(self):
+        """Log-mel features of the last recording (None if not computed)"""
+        return self.mel_features
+    
+    def _open_stream(self, rate):
+        """Open the default microphone - ensure it only captures microphone input"""
+        return self.audio.open(
+            format=pyaudio.paInt16,
+            channels=AUDIO_CHANNELS,
+            rate=rate,
+            input=True,
+            input_device_index=None,  # Use default microphone
+            frames_per_buffer=AUDIO_CHUNK_SIZE
+        )
+    
     def _record_audio(self):
         """Internal method to record audio in a separate thread"""
         try:
             while self.recording:
                 data = self.stream.read(AUDIO_CHUNK_SIZE, exception_on_overflow=False)
                 self.frames.append(data)
+                if self.mel_extractor:
+                    self._extract_features(data)
         except Exception as e:
             print(f"ERROR: Recording thread failed: {e}")
     
+    def _extract_features(self, data):
+        """Feed a chunk to the feature extractor, falling back to the WAV file on failure"""
+        try:
+            self.mel_extractor.accept(data)
+        except Exception as e:
+            print(f"ERROR: Feature extraction failed, will transcribe from file: {e}")
+            self.mel_extractor = None
+    
     def _save_audio(self):
         """Save recorded audio to temporary file"""
         try:
@@ -125,7 +174,7 @@ class AudioRecorder:
             with wave.open(str(TEMP_AUDIO_FILE), 'wb') as wf:
                 wf.setnchannels(AUDIO_CHANNELS)
                 wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-                wf.setframerate(AUDIO_SAMPLE_RATE)
+                wf.setframerate(self.sample_rate)
                 wf.writeframes(b''.join(self.frames))
                 
         except Exception as e:
@@ -13,10 +13,52 @@ AUDIO_CHANNELS = 1  # Mono
 AUDIO_CHUNK_SIZE = 1024
 AUDIO_FORMAT = 'wav'
 
+# Compute Whisper's log-mel features while recording so transcription can start
+# straight away at stop. Needs mono audio; while enabled the microphone is
+# captured at Whisper's native 16 kHz instead of AUDIO_SAMPLE_RATE.
+INCREMENTAL_MEL_FEATURES = True
+MEL_N_MELS = 80  # Must match the model (80 for all models except large-v3, which uses 128)
+MEL_FEATURE_DTYPE = 'float32'  # 'float16' halves feature memory for long recordings
+
 # Whisper Model Settings
 WHISPER_MODEL = 'base.en'  # Fast, local, good quality
 WHISPER_LANGUAGE = 'en'
 
+# Decoding Presets (speed vs accuracy)
+# Temperatures Whisper falls back through when a window fails its quality checks
+WHISPER_TEMPERATURE_LADDER = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+# Each preset maps onto whisper's transcribe() options. `max_fallback_retries`
+# caps how many times a single window may be re-decoded at a higher temperature
+# (0 = never retry, 5 = walk the whole ladder, which is Whisper's default).
+DECODE_PRESETS = {
+    'fastest': {
+        'beam_size': None,          # greedy decoding
+        'best_of': None,
+        'condition_on_previous_text': False,
+        'max_fallback_retries': 0,
+    },
+    'balanced': {
+        'beam_size': None,
+        'best_of': 2,
+        'condition_on_previous_text': True,
+        'max_fallback_retries': 2,
+    },
+    'standard': {                   # Whisper's own defaults, as used before presets existed
+        'beam_size': None,
+        'best_of': None,
+        'condition_on_previous_text': True,
+        'max_fallback_retries': 5,
+    },
+    'accurate': {
+        'beam_size': 5,
+        'best_of': 5,
+        'condition_on_previous_text': True,
+        'max_fallback_retries': 5,
+    },
+}
+DECODE_PRESET = 'standard'  # Used when transcribe_audio() is not given a preset
+
 # File Paths
 PROJECT_DIR = Path(__file__).parent.parent  # Go up one level from src/
 TRANSCRIPTS_DIR = PROJECT_DIR / 'transcripts'
@@ -30,9 +30,17 @@ def save_transcript(text):
         filename = f"transcript_{date_str}_{time_str}.txt"
         filepath = TRANSCRIPTS_DIR / filename
         
-        # Save the transcript
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(text)
+        # Save the transcript, adding a counter rather than overwriting a
+        # transcript saved in the same second
+        counter = 1
+        while True:
+            try:
+                with open(filepath, 'x', encoding='utf-8') as f:
+                    f.write(text)
+                break
+            except FileExistsError:
+                filepath = TRANSCRIPTS_DIR / f"transcript_{date_str}_{time_str}_{counter}.txt"
+                counter += 1
         
         if ENABLE_CONSOLE_FEEDBACK:
             print(f"Transcript saved: {filepath}")
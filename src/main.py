@@ -193,7 +193,10 @@ class HotkeyAudioTranscriber:
             print("🤖 Transcribing with Whisper AI...")
             
             # Transcribe the audio
-            transcript = self.transcriber.transcribe_audio(str(TEMP_AUDIO_FILE))
+            transcript = self.transcriber.transcribe_audio(
+                str(TEMP_AUDIO_FILE),
+                mel_features=self.audio_recorder.get_mel_features()
+            )
             
             if transcript:
                 # Save the transcript
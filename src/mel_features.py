@@ -0,0 +1,149 @@
+"""
+Incremental log-mel feature extraction for the Hotkey Audio Transcriber MVP
+
+Reproduces whisper.audio.log_mel_spectrogram() frame by frame while audio is
+being captured, so that only the (cheap) global normalization is left to do
+when recording stops.
+"""
+import os
+
+import numpy as np
+import whisper.audio
+from whisper.audio import HOP_LENGTH, N_FFT, N_SAMPLES, SAMPLE_RATE
+
+
+def _load_mel_filters(n_mels):
+    """Load the same mel filterbank Whisper ships with (n_mels x N_FFT//2+1)"""
+    path = os.path.join(os.path.dirname(whisper.audio.__file__), "assets", "mel_filters.npz")
+    with np.load(path, allow_pickle=False) as f:
+        return f[f"mel_{n_mels}"].astype(np.float32)
+
+
+class LogMelFeatures:
+    """Normalized log-mel frames for a finished recording
+
+    `frames` holds one column per hop of real audio plus the few frames whose
+    window still overlaps the end of the recording; everything after that is
+    pure silence padding and is represented by the single `pad_value`.
+    """
+
+    def __init__(self, frames, content_frames, pad_value, n_samples):
+        self.frames = frames
+        self.content_frames = content_frames
+        self.pad_value = pad_value
+        self.n_samples = n_samples
+
+    @property
+    def n_mels(self):
+        return self.frames.shape[0]
+
+    @property
+    def duration(self):
+        return self.n_samples / SAMPLE_RATE
+
+    def to_numpy(self, padding=N_SAMPLES):
+        """Frames as whisper.log_mel_spectrogram(audio, padding=padding) would return them
+
+        Only valid for `padding >= N_FFT // 2` (transcribe() always pads by
+        N_SAMPLES): with less, Whisper reflect-pads real audio at the end,
+        while these frames assume the recording is followed by silence.
+        """
+        if padding < N_FFT // 2:
+            raise ValueError(f"Precomputed features need padding >= {N_FFT // 2} samples, got {padding}")
+        total = self.content_frames + padding // HOP_LENGTH
+        mel = np.full((self.n_mels, total), self.pad_value, dtype=np.float32)
+        available = min(total, self.frames.shape[1])
+        mel[:, :available] = self.frames[:, :available]
+        return mel
+
+    def to_tensor(self, padding=N_SAMPLES, device=None):
+        import torch
+
+        mel = torch.from_numpy(self.to_numpy(padding))
+        if device is not None:
+            mel = mel.to(device)
+        return mel
+
+
+class IncrementalLogMel:
+    """Builds Whisper log-mel frames from 16 kHz int16 PCM chunks as they arrive
+
+    Every complete STFT window in a chunk is transformed in one vectorized
+    pass; the raw log10 mel power is kept in a compact array of `dtype` until
+    finalize() applies Whisper's global dynamic-range normalization.
+    """
+
+    def __init__(self, n_mels=80, dtype=np.float32):
+        self.filters = _load_mel_filters(n_mels)
+        # Periodic Hann window, matching torch.hann_window(N_FFT)
+        self.window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N_FFT) / N_FFT)).astype(np.float32)
+        self.dtype = np.dtype(dtype)
+        self.n_samples = 0
+        self._head = []            # first samples, held until the reflect padding is known
+        self._buffer = None        # padded signal from the start of the next frame onwards
+        self._chunks = []          # (frames, n_mels) arrays of log10 mel power
+        self._n_frames = 0
+
+    def accept(self, data):
+        """Feed raw little-endian int16 mono PCM bytes"""
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+        self.n_samples += len(samples)
+
+        if self._buffer is None:
+            self._head.append(samples)
+            head = np.concatenate(self._head)
+            if len(head) <= N_FFT // 2:
+                return
+            self._head = []
+            self._buffer = np.concatenate([head[N_FFT // 2:0:-1], head])
+        else:
+            self._buffer = np.concatenate([self._buffer, samples])
+
+        self._consume()
+
+    def finalize(self):
+        """Flush the tail of the recording and return normalized LogMelFeatures"""
+        if self._buffer is None:
+            # Shorter than the reflect padding: Whisper reflects into its zero padding
+            head = np.concatenate(self._head + [np.zeros(N_FFT // 2 + 1, dtype=np.float32)])
+            self._buffer = np.concatenate([head[N_FFT // 2:0:-1], head[:self.n_samples]])
+
+        content_frames = self.n_samples // HOP_LENGTH
+        # Frames whose window reaches back into the recording; later ones are all zeros
+        edge_frames = -(-(self.n_samples + N_FFT // 2) // HOP_LENGTH)
+        needed = (edge_frames - 1) * HOP_LENGTH + N_FFT
+        consumed = self._n_frames * HOP_LENGTH
+        tail = max(0, needed - consumed - len(self._buffer))
+        self._buffer = np.concatenate([self._buffer, np.zeros(tail, dtype=np.float32)])
+        self._consume(limit=edge_frames)
+
+        log_spec = (
+            np.concatenate(self._chunks).T.astype(np.float32)
+            if self._chunks else np.zeros((self.filters.shape[0], 0), dtype=np.float32)
+        )
+        self._chunks = []
+        self._buffer = None
+
+        # Whisper's global normalization; silent padding frames sit at log10(1e-10)
+        floor = np.float32(-10.0)
+        peak = max(float(log_spec.max()), floor) if log_spec.size else floor
+        log_spec = np.maximum(log_spec, peak - 8.0)
+        frames = ((log_spec + 4.0) / 4.0).astype(self.dtype)
+        pad_value = (max(floor, peak - 8.0) + 4.0) / 4.0
+
+        return LogMelFeatures(frames, content_frames, pad_value, self.n_samples)
+
+    def _consume(self, limit=None):
+        """Transform every complete window in the buffer and drop the used samples"""
+        n = (len(self._buffer) - N_FFT) // HOP_LENGTH + 1 if len(self._buffer) >= N_FFT else 0
+        if limit is not None:
+            n = min(n, limit - self._n_frames)
+        if n <= 0:
+            return
+
+        windows = np.lib.stride_tricks.sliding_window_view(self._buffer, N_FFT)[::HOP_LENGTH][:n]
+        power = np.abs(np.fft.rfft(windows * self.window, axis=1)) ** 2
+        mel = power.astype(np.float32) @ self.filters.T
+        self._chunks.append(np.log10(np.maximum(mel, 1e-10)).astype(self.dtype))
+        self._n_frames += n
+        self._buffer = self._buffer[n * HOP_LENGTH:]
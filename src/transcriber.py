@@ -2,18 +2,44 @@
 Transcription module for the Hotkey Audio Transcriber MVP
 """
 import whisper
+import importlib
 import os
 import textwrap
 from pathlib import Path
 from config import (
     WHISPER_MODEL,
     WHISPER_LANGUAGE,
+    WHISPER_TEMPERATURE_LADDER,
+    DECODE_PRESETS,
+    DECODE_PRESET,
     ENABLE_CONSOLE_FEEDBACK,
     PAUSE_BREAK_THRESHOLD_S,
     INCLUDE_TIMESTAMPS,
     MAX_LINE_LENGTH,
     ENFORCE_SENTENCE_CASING,
 )
+from mel_features import LogMelFeatures
+
+
+def _install_precomputed_mel_hook():
+    """Let whisper.transcribe() accept LogMelFeatures in place of audio
+
+    transcribe() always starts by computing the log-mel spectrogram of its
+    input; for precomputed features we hand back the stored frames instead.
+    """
+    # `whisper.transcribe` is shadowed by the function, so fetch the module itself
+    module = importlib.import_module("whisper.transcribe")
+    original = module.log_mel_spectrogram
+    if getattr(original, "accepts_precomputed", False):
+        return
+
+    def log_mel_spectrogram(audio, n_mels=80, padding=0, device=None):
+        if isinstance(audio, LogMelFeatures):
+            return audio.to_tensor(padding, device)
+        return original(audio, n_mels, padding, device)
+
+    log_mel_spectrogram.accepts_precomputed = True
+    module.log_mel_spectrogram = log_mel_spectrogram
 
 
 class Transcriber:
@@ -29,6 +55,7 @@ class Transcriber:
                 print("This may take a moment on first run...")
             
             self.model = whisper.load_model(WHISPER_MODEL)
+            _install_precomputed_mel_hook()
             self.model_loaded = True
             
             if ENABLE_CONSOLE_FEEDBACK:
@@ -40,8 +67,37 @@ class Transcriber:
             print("Make sure you have internet connection for first-time model download")
             return False
     
-    def transcribe_audio(self, audio_file_path):
-        """Transcribe audio file using Whisper"""
+    def get_decode_options(self, preset=None):
+        """Build whisper.transcribe() options for a named decode preset"""
+        name = preset or DECODE_PRESET
+        if name not in DECODE_PRESETS:
+            raise ValueError(
+                f"Unknown decode preset '{name}' (choose from: {', '.join(DECODE_PRESETS)})"
+            )
+
+        options = dict(DECODE_PRESETS[name])
+        # Whisper retries a window once per extra temperature, so truncating
+        # the ladder caps the number of fallback re-decodes per window
+        retries = max(0, int(options.pop("max_fallback_retries")))
+        options["temperature"] = tuple(WHISPER_TEMPERATURE_LADDER[:retries + 1])
+        return options
+
+    def run_whisper(self, audio, preset=None):
+        """Run Whisper with the given preset and return its raw result dict"""
+        return self.model.transcribe(
+            audio,
+            language=WHISPER_LANGUAGE,
+            fp16=False,  # Use fp32 for better compatibility
+            **self.get_decode_options(preset)
+        )
+
+    def transcribe_audio(self, audio_file_path, preset=None, mel_features=None):
+        """Transcribe audio file using Whisper
+
+        `preset` names an entry in DECODE_PRESETS (defaults to DECODE_PRESET).
+        `mel_features` are log-mel features computed while recording; when they
+        suit the loaded model, Whisper skips its own feature extraction.
+        """
         try:
             if not self.model_loaded:
                 if ENABLE_CONSOLE_FEEDBACK:
@@ -49,7 +105,13 @@ class Transcriber:
                 if not self.load_model():
                     return None
             
-            if not Path(audio_file_path).exists():
+            if mel_features is not None and mel_features.n_mels != self.model.dims.n_mels:
+                if ENABLE_CONSOLE_FEEDBACK:
+                    print(f"WARNING: Precomputed features have {mel_features.n_mels} mel bins, "
+                          f"model expects {self.model.dims.n_mels}; using audio file")
+                mel_features = None
+            
+            if mel_features is None and not Path(audio_file_path).exists():
                 print(f"ERROR: Audio file not found: {audio_file_path}")
                 return None
             
@@ -57,11 +119,8 @@ class Transcriber:
                 print("Transcribing audio...")
             
             # Transcribe the audio (segments contain timestamps)
-            result = self.model.transcribe(
-                audio_file_path,
-                language=WHISPER_LANGUAGE,
-                fp16=False  # Use fp32 for better compatibility
-            )
+            audio = mel_features if mel_features is not None else audio_file_path
+            result = self.run_whisper(audio, preset=preset)
 
             # Prefer segment-aware formatting for better readability
             segments = result.get("segments") or []
@@ -165,6 +224,7 @@ class Transcriber:
             return {
                 'model_name': WHISPER_MODEL,
                 'language': WHISPER_LANGUAGE,
+                'decode_preset': DECODE_PRESET,
                 'loaded': True
             }
         return {'loaded': False}